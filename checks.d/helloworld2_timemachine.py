@@ -0,0 +1,206 @@
+import os
+import re
+import stat
+import time
+from datetime import datetime
+
+from datadog_checks.base import AgentCheck
+
+# Matches Time Machine timestamps like: 2025-09-30-012615
+# Groups: year, month, day, hour, minute, second
+_TS_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})-(\d{2})(\d{2})(\d{2})")
+
+
+def _spawn_capture(argv):
+    """Run argv and return its stdout as text (lighter than subprocess.check_output)."""
+    r, w = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            argv[0],
+            argv,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, w, 1),
+                (os.POSIX_SPAWN_CLOSE, r),
+                (os.POSIX_SPAWN_CLOSE, w),
+            ],
+        )
+    except BaseException:
+        os.close(r)
+        os.close(w)
+        raise
+
+    os.close(w)
+    chunks = []
+    try:
+        while True:
+            chunk = os.read(r, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(r)
+        _, status = os.waitpid(pid, 0)
+
+    returncode = os.waitstatus_to_exitcode(status)
+    if returncode != 0:
+        raise RuntimeError(f"{argv[0]} exited with status {returncode}")
+
+    return b"".join(chunks).decode()
+
+
+def _is_mountpoint(path):
+    """Return True if path is a mountpoint; a missing path is just "not mounted"."""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return False
+    if stat.S_ISLNK(st.st_mode):
+        return False
+
+    # A mountpoint lives on a different device than its parent directory (or is "/").
+    # Unlike os.path.ismount(), errors other than "not found" are raised to the caller.
+    parent = os.lstat(os.path.join(path, ".."))
+    return st.st_dev != parent.st_dev or st.st_ino == parent.st_ino
+
+
+def _local_epoch(year, month, day, hour, minute, second):
+    """Convert a local wall-clock time to integer epoch seconds."""
+    # datetime() rejects out-of-range fields (time.mktime would silently normalize them).
+    # Only called when the tmutil cache is refreshed, not on every run.
+    return int(time.mktime(datetime(year, month, day, hour, minute, second).timetuple()))
+
+
+def _parse_latest_backup(out):
+    """Return the backup time found in `tmutil latestbackup` output, as epoch seconds."""
+    # NOTE: tmutil outputs timestamps in local time; for monitoring "age" this is fine.
+    # If you want absolute timezone correctness, we can switch to filesystem metadata.
+
+    # Fast path: the timestamp sits right before the first ".backup" (17 chars)
+    i = out.find(".backup")
+    if i >= 17:
+        ts = out[i - 17:i]  # e.g. 2025-09-30-012615
+        # int() also accepts signs, "_" and non-ASCII digits, so check the fields are plain digits
+        if (
+            ts.isascii()
+            and ts[4] == "-" and ts[7] == "-" and ts[10] == "-"
+            and ts[0:4].isdigit() and ts[5:7].isdigit() and ts[8:10].isdigit() and ts[11:17].isdigit()
+        ):
+            try:
+                return _local_epoch(
+                    int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[13:15]), int(ts[15:17]),
+                )
+            except ValueError:
+                pass  # not a valid timestamp after all; fall back to the regex
+
+    # Find a Time Machine timestamp anywhere in the output
+    m = _TS_RE.search(out)
+    if not m:
+        raise ValueError(f"Could not find a Time Machine timestamp in output: {out}")
+
+    # Build the time straight from the captured digit groups (no strptime).
+    g = m.groups()
+    return _local_epoch(int(g[0]), int(g[1]), int(g[2]), int(g[3]), int(g[4]), int(g[5]))
+
+
+class Helloworld2TimeMachine(AgentCheck):
+    """
+    Datadog custom check for macOS Time Machine (latest backup + destination mount).
+
+    Emits:
+      - helloworld2.timemachine.latest_backup_heartbeat (always 1)
+      - helloworld2.timemachine.latest_backup_seconds (seconds since latest completed backup)
+      - helloworld2.timemachine.heartbeat (always 1)
+      - helloworld2.timemachine.disk_mounted (1 if the destination is mounted, else 0)
+      - service check helloworld2.timemachine.latest_backup (OK/CRITICAL)
+      - service check helloworld2.timemachine.disk.mounted (OK/CRITICAL)
+    """
+
+    # Time Machine completes at most one backup an hour, so the parsed result of
+    # `tmutil latestbackup` is reused for this long; the age is recomputed every run.
+    BACKUP_CACHE_TTL = 300  # seconds
+
+    # Shared by all instances: tmutil reports host-wide state.
+    _backup_cache = {"ts": None, "fetched_at": 0.0}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each check object runs a single instance whose tags never change; build them once
+        instance = self.instance or {}
+        mountpoint = instance.get("mountpoint", "/Volumes/SEAGATE TIME MACHINE 5T")
+        self._tags = (*instance.get("tags", []), f"mountpoint:{mountpoint}")
+        # Backup series keep their own tag set (as before the checks were merged), no mountpoint tag
+        self._backup_tags = tuple(instance.get("latest_backup_tags", instance.get("tags", [])))
+
+    def _get_latest_backup_ts(self):
+        cache = self._backup_cache
+        if cache["ts"] is not None and time.monotonic() - cache["fetched_at"] < self.BACKUP_CACHE_TTL:
+            return cache["ts"]
+
+        # Example output can look like:
+        # /Volumes/.timemachine/<UUID>/2025-09-30-012615.backup/2025-09-30-012615.backup
+        out = _spawn_capture(["/usr/bin/tmutil", "latestbackup"]).strip()
+
+        backup_ts = _parse_latest_backup(out)
+        cache["ts"] = backup_ts
+        cache["fetched_at"] = time.monotonic()
+        return backup_ts
+
+    def check(self, instance):
+        mountpoint = instance.get("mountpoint", "/Volumes/SEAGATE TIME MACHINE 5T")
+
+        # Heartbeats: prove the check is executing and can emit metrics
+        self.gauge("helloworld2.timemachine.latest_backup_heartbeat", 1, tags=self._backup_tags)
+        self.gauge("helloworld2.timemachine.heartbeat", 1, tags=self._tags)
+
+        self._check_latest_backup(self._backup_tags)
+        self._check_mount(mountpoint, self._tags)
+
+    def _check_latest_backup(self, tags):
+        latest_backup_seconds = -1  # -1 means "unknown / could not determine"
+
+        try:
+            backup_ts = self._get_latest_backup_ts()
+
+            # Compute age in whole seconds from epoch timestamps
+            now_ts = int(time.time())
+            latest_backup_seconds = now_ts - backup_ts
+
+            if latest_backup_seconds < 0:
+                # Guard against clock skew / timezone quirks
+                latest_backup_seconds = 0
+
+            # Service check OK: we successfully computed an age
+            self.service_check("helloworld2.timemachine.latest_backup", self.OK, tags=tags)
+
+        except Exception as e:
+            # Service check CRITICAL: we could not compute an age
+            self.service_check(
+                "helloworld2.timemachine.latest_backup",
+                self.CRITICAL,
+                message=str(e),
+                tags=tags,
+            )
+
+        # Always emit the metric, even on failure (-1)
+        self.gauge("helloworld2.timemachine.latest_backup_seconds", latest_backup_seconds, tags=tags)
+
+    def _check_mount(self, mountpoint, tags):
+        # Default
+        mounted = 0
+
+        try:
+            # stat-based probe: no /sbin/mount spawn, but permission/IO errors still surface
+            mounted = 1 if _is_mountpoint(mountpoint) else 0
+        except Exception as e:
+            self.service_check("helloworld2.timemachine.mount.check", self.CRITICAL, message=str(e), tags=tags)
+            mounted = 0  # keep going, still emit metric
+
+        # Always emit
+        self.gauge("helloworld2.timemachine.disk_mounted", mounted, tags=tags)
+
+        # Optional: service check that mirrors the state
+        status = self.OK if mounted else self.CRITICAL
+        msg = "Time Machine disk is mounted" if mounted else "Time Machine disk is NOT mounted"
+        self.service_check("helloworld2.timemachine.disk.mounted", status, message=msg, tags=tags)
@@ -15,10 +15,16 @@ class Helloworld2TimeMachineDiskSpace(AgentCheck):
       - service check helloworld2.timemachine.disk.accessible (OK/CRITICAL)
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each check object runs a single instance whose tags never change; build them once
+        instance = self.instance or {}
+        mountpoint = instance.get("mountpoint", "/Volumes/SEAGATE TIME MACHINE 5T")
+        self._tags = (*instance.get("tags", []), f"mountpoint:{mountpoint}")
+
     def check(self, instance):
         mountpoint = instance.get("mountpoint", "/Volumes/SEAGATE TIME MACHINE 5T")
-        tags = list(instance.get("tags", []))
-        tags.append(f"mountpoint:{mountpoint}")
+        tags = self._tags
 
         try:
             usage = shutil.disk_usage(mountpoint)